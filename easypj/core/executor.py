@@ -1,9 +1,19 @@
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from tempfile import mkdtemp
 
-import easyvvuq as uq
-from qcg.appscheduler.api.job import Jobs
-from qcg.appscheduler.api.manager import LocalManager
+
+# memory backed filesystem available on most Linux systems
+SHM_DIR = "/dev/shm"
+
+# statuses of QCG PJ tasks that won't change anymore
+FINISHED_TASK_STATES = {"SUCCEED", "FAILED", "CANCELED", "OMITTED"}
 
 
 class ServiceLogLevel(Enum):
@@ -56,6 +66,8 @@ class Task:
         additional parameters that may be used by specific Task types
     """
 
+    __slots__ = ('_type', '_requirements', '_params', '_name')
+
     def __init__(self, type, requirements, name=None, **params):
         self._type = type
         self._requirements = requirements
@@ -75,17 +87,94 @@ class Task:
         return self._name
 
 
+class _ChunkedSubmission:
+    """Collects QCG PJ tasks and submits them in chunks of a bounded size
+
+    Parameters
+    ----------
+    submit : callable
+        Function called with a qcg.appscheduler.api.job.Jobs object and a dictionary
+        mapping names of tracked tasks to run ids, once a chunk is complete
+    chunk_size : int
+        The maximal number of tasks submitted at once
+    """
+
+    def __init__(self, submit, chunk_size):
+        from qcg.appscheduler.api.job import Jobs
+
+        self._submit = submit
+        self._chunk_size = chunk_size
+        self._new_jobs = Jobs
+        self._jobs = Jobs()
+        self._size = 0
+        self._tracked = {}
+
+    def add(self, task, run_id=None):
+        """Adds a task to the current chunk, submits the chunk if it is full
+
+        Parameters
+        ----------
+        task : dict
+            The QCG PJ task description
+        run_id : str, optional
+            If given, the run is marked as processed once the task is finished
+
+        Returns
+        -------
+        None
+
+        """
+        self._jobs.addStd(task)
+        self._size += 1
+        if run_id is not None:
+            self._tracked[task["name"]] = run_id
+
+        if self._size >= self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Submits the tasks collected so far"""
+        if self._size:
+            self._submit(self._jobs, self._tracked)
+
+        self._jobs = self._new_jobs()
+        self._size = 0
+        self._tracked = {}
+
+
 class Executor:
     """Integrates EasyVVUQ and QCG Pilot Job manager
 
     Executor allows to process the most demanding operations of EasyVVUQ in parallel
     using QCG Pilot Job.
 
+    Parameters
+    ----------
+    submit_chunk_size : int, optional
+        The maximal number of tasks submitted to QCG Pilot Job Manager at once.
+        Larger chunks reduce the number of requests sent to the manager,
+        while the limit keeps the size of a single request bounded.
+
     """
-    def __init__(self):
+    def __init__(self, submit_chunk_size=1024):
+        self._submit_chunk_size = submit_chunk_size
         self._qcgpjm = None
-        self._tasks = {}
+        self._resources_info = None
+        self._qcgpjm_lock = threading.Lock()
+        self._status_poll_delay = 1
+        self._encoding_task = None
+        self._execution_task = None
+        self._encoding_and_execution_task = None
+        self._other_task = None
         self._qcgpj_tempdir = "."
+        self._work_dir = "."
+        self._logs_dir = None
+        self._submit_handlers = {
+            SubmitOrder.PHASE_ORIENTED: self.__submit_phase_oriented,
+            SubmitOrder.RUN_ORIENTED: self.__submit_run_oriented,
+            SubmitOrder.RUN_ORIENTED_CONDENSED: self.__submit_run_oriented_condensed,
+            SubmitOrder.EXEC_ONLY: self.__submit_exec_only
+        }
 
     def set_manager(self, qcgpjm):
         """Sets existing QCG Pilot Job Manager as the Executor's engine
@@ -102,19 +191,32 @@ class Executor:
         """
 
         self._qcgpjm = qcgpjm
-        print("Available resources:\n%s\n" % str(self._qcgpjm.resources()))
+        self._resources_info = None
+        # without a dedicated directory, stdout and stderr of tasks are written directly
+        # to the QCG PJ temp directory
+        self._logs_dir = None
+        self.print_resources_info()
 
-    def create_manager(self, dir=".",
+    def create_manager(self, dir=None,
                        resources=None,
                        reserve_core=False,
-                       log_level='debug'):
+                       log_level='debug',
+                       tmpfs=False):
         """Creates new QCG Pilot Job Manager and sets is as the Executor's engine
 
         Parameters
         ----------
-        dir : str
+        dir : str, optional
             The path to the directory where Executor should init QCG Pilot Job Manager.
-            Inside dir a subdirectory for workdir of QCG PJ manager will be created
+            If not specified, the value of the EASYPJ_SCRATCH environment variable is used,
+            or the current directory if it isn't set. The directory must be visible from every
+            node of the allocation, since tasks on all nodes use it, so EASYPJ_SCRATCH should
+            point to a fast, shared filesystem. TMPDIR is deliberately not used, as on many
+            HPC systems it points to a node-local storage.
+            Inside dir a unique `.qcgpj-*` subdirectory is created for the Executor. It contains
+            `jobs` - the workdir of QCG PJ manager, `work` - the working directory of tasks
+            and `logs` - stdout and stderr files of tasks, so Executors sharing the same dir
+            don't interfere with each other
         resources : str, optional
             The resources to use. If specified forces usage of Local mode of QCG Pilot Job Manager.
             The format is compliant with the NODES format of QCG Pilot Job, i.e.:
@@ -127,6 +229,14 @@ class Executor:
             Parameters
         log_level : str, optional
             Logging level for QCG Pilot Job Manager (for both service and client part).
+        tmpfs : bool, optional
+            If True and /dev/shm is available and writable, the workdir of QCG Pilot Job Manager
+            (including stdout and stderr files of tasks) is created in /dev/shm instead of dir,
+            which reduces the I/O overhead for many short tasks. The content of /dev/shm
+            is kept in memory and is lost on reboot, so it should not be used for the files
+            that have to be preserved. If /dev/shm can't be used, dir is used instead.
+            Since /dev/shm is local to a node, tasks running on other nodes can't access
+            this directory, so the option may be used only for single-node allocations.
 
         Returns
         -------
@@ -136,8 +246,20 @@ class Executor:
 
         # ---- QCG PILOT JOB INITIALISATION ---
         # set QCG-PJ temp directory
+        if not dir:
+            dir = os.environ.get("EASYPJ_SCRATCH") or "."
+
+        if tmpfs and os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+            dir = SHM_DIR
+
         self._qcgpj_tempdir = mkdtemp(None, ".qcgpj-", dir)
 
+        jobs_dir = f"{self._qcgpj_tempdir}/jobs"
+        os.mkdir(jobs_dir)
+        self._work_dir = f"{self._qcgpj_tempdir}/work"
+        os.mkdir(self._work_dir)
+        self._init_logs_dir()
+
         log_level = log_level.upper()
 
         try:
@@ -150,10 +272,10 @@ class Executor:
         except KeyError:
             client_log_level = ClientLogLevel.DEBUG.value
 
-        client_conf = {'log_file': self._qcgpj_tempdir + '/api.log', 'log_level': client_log_level}
+        client_conf = {'log_file': f"{self._qcgpj_tempdir}/api.log", 'log_level': client_log_level}
 
         common_args = ['--log', service_log_level,
-                       '--wd', self._qcgpj_tempdir]
+                       '--wd', jobs_dir]
 
         args = common_args
 
@@ -165,10 +287,34 @@ class Executor:
             args.append('--system-core')
 
         # create QCGPJ Manager (service part)
+        from qcg.appscheduler.api.manager import LocalManager
         self._qcgpjm = LocalManager(args, client_conf)
+        self._resources_info = None
+
+    def _init_logs_dir(self):
+        """Creates the directory tree for stdout and stderr files of QCG PJ tasks
+
+        The files are spread over 256 subdirectories of `logs` in order to keep
+        the number of entries in a single directory bounded for large campaigns.
+
+        """
+        self._logs_dir = f"{self._qcgpj_tempdir}/logs"
+        for shard in range(256):
+            os.makedirs(f"{self._logs_dir}/{shard:02x}", exist_ok=True)
+
+    def _get_logs_dir(self, key):
+        if self._logs_dir is None:
+            return self._qcgpj_tempdir
+
+        shard = hashlib.blake2s(key.encode(), digest_size=1).hexdigest()
+        return f"{self._logs_dir}/{shard}"
 
     def print_resources_info(self):
-        print("Available resources:\n%s\n" % str(self._qcgpjm.resources()))
+        # resources of the manager don't change, so they are requested only once
+        if self._resources_info is None:
+            self._resources_info = str(self._qcgpjm.resources())
+
+        print("Available resources:\n%s\n" % self._resources_info)
 
     def add_task(self, task):
         """
@@ -183,187 +329,375 @@ class Executor:
         -------
         None
 
+        Raises
+        ------
+        ValueError
+            If the type of the task is not one of easypj.TaskType values
+
         """
-        self._tasks[task.get_name()] = task
+        task_type = task.get_type()
+
+        if task_type == TaskType.ENCODING:
+            self._encoding_task = task
+        elif task_type == TaskType.EXECUTION:
+            self._execution_task = task
+        elif task_type == TaskType.ENCODING_AND_EXECUTION:
+            self._encoding_and_execution_task = task
+        elif task_type == TaskType.OTHER:
+            self._other_task = task
+        else:
+            raise ValueError(f"Unsupported type of the task: {task_type}")
+
+    def _get_task_template(self, task, exec):
+        """Builds the part of a QCG PJ task description that is common for all runs
 
-    def _get_encoding_task(self, campaign, run):
+        Parameters
+        ----------
+        task : easypj.Task
+            The task for which the template is created
+        exec : str
+            The executable that will be invoked by QCG PJ for the task
 
-        task = self._tasks.get(TaskType.ENCODING)
-        requirements = task.get_requirements().get_resources()
+        Returns
+        -------
+        dict
+            The task description without the run specific elements. Its substructures are
+            shared by descriptions of all tasks created from the template, so they can't be
+            modified in place
 
-        key = run[0]
+        """
+        return {
+            "execution": {
+                "exec": exec,
+                "wd": self._work_dir
+            },
+            "resources": task.get_requirements().get_resources()["resources"]
+        }
 
-        enc_args = [
-            campaign.db_type,
-            campaign.db_location,
-            'FALSE',
-            campaign.campaign_name,
-            campaign._active_app_name,
-            key
-        ]
+    def _get_encoding_task(self, enc_head, key, template):
+
+        logs_dir = self._get_logs_dir(key)
+
+        enc_args = [*enc_head, key]
 
         encode_task = {
-            "name": 'encode_' + key,
+            "name": f"encode_{key}",
             "execution": {
-                "exec": 'easyvvuq_encode',
+                **template["execution"],
                 "args": enc_args,
-                "wd": self._qcgpj_tempdir,
-                "stdout": self._qcgpj_tempdir + '/encode_' + key + '.stdout',
-                "stderr": self._qcgpj_tempdir + '/encode_' + key + '.stderr'
-            }
+                "stdout": f"{logs_dir}/encode_{key}.stdout",
+                "stderr": f"{logs_dir}/encode_{key}.stderr"
+            },
+            "resources": template["resources"]
         }
 
-        encode_task.update(requirements)
-
         return encode_task
 
-    def _get_exec_task(self, campaign, run):
+    def _build_exec_task(self, key, run_data, template, application, with_dep):
 
-        task = self._tasks.get(TaskType.EXECUTION)
-        application = task.get_params().get("application")
-        requirements = task.get_requirements().get_resources()
-
-        key = run[0]
-        run_dir = run[1]['run_dir']
+        logs_dir = self._get_logs_dir(key)
 
         exec_args = [
-            run_dir,
+            run_data['run_dir'],
             'easyvvuq_app',
             application
         ]
 
         execute_task = {
-            "name": 'execute_' + key,
+            "name": f"execute_{key}",
             "execution": {
-                "exec": 'easyvvuq_execute',
+                **template["execution"],
                 "args": exec_args,
-                "wd": self._qcgpj_tempdir,
-                "stdout": self._qcgpj_tempdir + '/execute_' + key + '.stdout',
-                "stderr": self._qcgpj_tempdir + '/execute_' + key + '.stderr'
+                "stdout": f"{logs_dir}/execute_{key}.stdout",
+                "stderr": f"{logs_dir}/execute_{key}.stderr"
             },
-            "dependencies": {
-                "after": ["encode_" + key]
-            }
+            "resources": template["resources"]
         }
 
-        execute_task.update(requirements)
+        if with_dep:
+            execute_task["dependencies"] = {
+                "after": [f"encode_{key}"]
+            }
 
         return execute_task
 
-    def _get_encoding_and_exec_task(self, campaign, run):
+    def _get_exec_task(self, key, run_data, template, application):
+        return self._build_exec_task(key, run_data, template, application, with_dep=True)
 
-        task = self._tasks.get(TaskType.ENCODING_AND_EXECUTION)
-        application = task.get_params().get("application")
-        requirements = task.get_requirements().get_resources()
+    def _get_encoding_and_exec_task(self, enc_head, key, run_data, template, application):
 
-        key = run[0]
-        run_dir = run[1]['run_dir']
+        logs_dir = self._get_logs_dir(key)
 
         args = [
-            campaign.db_type,
-            campaign.db_location,
-            'FALSE',
-            campaign.campaign_name,
-            campaign._active_app_name,
+            *enc_head,
             key,
 
-            run_dir,
+            run_data['run_dir'],
             'easyvvuq_app',
             application
         ]
 
         encode_execute_task = {
-            "name": 'encode_execute_' + key,
+            "name": f"encode_execute_{key}",
             "execution": {
-                "exec": 'easyvvuq_encode_execute',
+                **template["execution"],
                 "args": args,
-                "wd": self._qcgpj_tempdir,
-                "stdout": self._qcgpj_tempdir + '/encode_execute_' + key + '.stdout',
-                "stderr": self._qcgpj_tempdir + '/encode_execute_' + key + '.stderr'
-            }
+                "stdout": f"{logs_dir}/encode_execute_{key}.stdout",
+                "stderr": f"{logs_dir}/encode_execute_{key}.stderr"
+            },
+            "resources": template["resources"]
         }
 
-        encode_execute_task.update(requirements)
-
         return encode_execute_task
 
-    def _get_exec_only_task(self, campaign, run):
-
-        task = self._tasks.get(TaskType.EXECUTION)
-        application = task.get_params().get("application")
-        requirements = task.get_requirements().get_resources()
-
-        key = run[0]
-        run_dir = run[1]['run_dir']
-
-        exec_args = [
-            run_dir,
-            'easyvvuq_app',
-            application
-        ]
-
-        execute_task = {
-            "name": 'execute_' + key,
-            "execution": {
-                "exec": 'easyvvuq_execute',
-                "args": exec_args,
-                "wd": self._qcgpj_tempdir,
-                "stdout": self._qcgpj_tempdir + '/execute_' + key + '.stdout',
-                "stderr": self._qcgpj_tempdir + '/execute_' + key + '.stderr'
-            }
-        }
-
-        execute_task.update(requirements)
-
-        return execute_task
+    def _get_exec_only_task(self, key, run_data, template, application):
+        return self._build_exec_task(key, run_data, template, application, with_dep=False)
 
     def run(self, campaign, submit_order=SubmitOrder.RUN_ORIENTED):
         """ Executes demanding parts of EasyVVUQ campaign with QCG Pilot Job
 
         A user may choose the preferred execution scheme for the given scenario.
 
+        The tasks are submitted to QCG Pilot Job Manager in a background thread,
+        while the statuses of runs are synced with the campaign as soon as
+        their tasks are completed.
+
         campaign : easyvvuq.campaign
             The campaign object that would be processed. It has to be previously initialised.
         submit_order: easypj.SubmitOrder
             EasyVVUQ tasks submission order
         """
+        import easyvvuq as uq
+
+        # the campaign database is accessed only from the calling thread
+        runs = campaign.list_runs()
+        app_id = campaign._active_app['id']
+        new_run_ids = {run_id for run_id, run_data in runs
+                       if run_data['status'] == uq.constants.Status.NEW
+                       and run_data['app'] == app_id}
+
         # ---- EXECUTION ---
         # Execute encode -> execute for each run using QCG-PJ
-        self.__submit_jobs(campaign, submit_order)
+        submitted = queue.Queue()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            submission = pool.submit(self.__submit_jobs, campaign, runs, submit_order, submitted)
+
+            print("Syncing state of campaign during execution of PJ")
+            self.__sync_statuses(campaign, new_run_ids, submitted)
+
+            # propagate a submission error, if any
+            submission.result()
 
         # wait for completion of all PJ tasks
         self._qcgpjm.wait4all()
 
-        print("Syncing state of campaign after execution of PJ")
+        # update statuses of runs that haven't been synced during the execution
+        self.__mark_new_runs_encoded(campaign)
+
+    @staticmethod
+    def __mark_new_runs_encoded(campaign):
+        """Changes the status of runs of the campaign's active app from NEW to ENCODED
+
+        Only the identifiers of the runs are fetched from the campaign database, not
+        the whole run records. Doing it with a single UPDATE ... WHERE statement would
+        require support in EasyVVUQ's CampaignDB.
+
+        Parameters
+        ----------
+        campaign : easyvvuq.campaign
+            The processed campaign
+
+        Returns
+        -------
+        None
+
+        """
+        import easyvvuq as uq
+
+        run_ids = list(campaign.campaign_db.run_ids(
+            status=uq.constants.Status.NEW, app_id=campaign._active_app['id']))
+        if run_ids:
+            campaign.campaign_db.set_run_statuses(run_ids, uq.constants.Status.ENCODED)
+
+    def __sync_statuses(self, campaign, new_run_ids, submitted):
+        """Marks runs as encoded once their QCG PJ tasks are finished
+
+        Parameters
+        ----------
+        campaign : easyvvuq.campaign
+            The processed campaign
+        new_run_ids : set
+            Identifiers of runs of the active app that had the NEW status before the execution
+        submitted : queue.Queue
+            Queue of dictionaries mapping names of the last submitted task of a run to the run id,
+            the end of submission is marked with None
+
+        Returns
+        -------
+        None
+
+        """
+        import easyvvuq as uq
+
+        # submitted batches of tasks, from the oldest one
+        batches = deque()
+        submitting = True
+        next_poll = time.monotonic() + self._status_poll_delay
+
+        while submitting or batches:
+            timeout = max(next_poll - time.monotonic(), 0)
+
+            if submitting:
+                # collect newly submitted tasks until the next poll is due
+                try:
+                    tasks = submitted.get(timeout=timeout)
+                except queue.Empty:
+                    pass
+                else:
+                    if tasks is None:
+                        submitting = False
+                    else:
+                        batches.append(tasks)
+
+                    if submitting and time.monotonic() < next_poll:
+                        continue
+            else:
+                time.sleep(timeout)
+
+            next_poll = time.monotonic() + self._status_poll_delay
+
+            # batches are polled in turns, so a long task in one batch doesn't hold back
+            # syncing of the others; when all tasks of a batch are finished, the batch
+            # is dropped and the next one is polled in the same round
+            while batches:
+                batch = batches[0]
+                run_ids = self.__poll_batch(batch, new_run_ids)
+                if run_ids:
+                    try:
+                        campaign.campaign_db.set_run_statuses(
+                            run_ids, uq.constants.Status.ENCODED)
+                    except Exception as e:
+                        # the database may be temporarily locked by the running encoders,
+                        # these runs will be updated after completion of all tasks
+                        print(f"Postponed syncing state of {len(run_ids)} runs: {e}")
+
+                if batch:
+                    batches.rotate(-1)
+                    break
+                batches.popleft()
+
+    def __poll_batch(self, batch, new_run_ids):
+        """Removes finished tasks from the batch
+
+        Parameters
+        ----------
+        batch : dict
+            Names of tracked tasks mapped to run ids, modified in place
+        new_run_ids : set
+            Identifiers of runs that had the NEW status before the execution
 
-        def update_status(run_id, run_data):
-            campaign.campaign_db.set_run_statuses([run_id], uq.constants.Status.ENCODED)
+        Returns
+        -------
+        list
+            Identifiers of NEW runs whose tasks are finished
 
-        campaign.call_for_each_run(update_status, status=uq.constants.Status.NEW)
+        """
+        with self._qcgpjm_lock:
+            statuses = self._qcgpjm.status(list(batch))
+
+        jobs = statuses.get('jobs', {})
+        run_ids = []
+        for name in list(batch):
+            status = jobs.get(name, {}).get('data', {}).get('status')
+            if status is None:
+                # the task isn't reported by the manager, its run will be updated
+                # after completion of all tasks
+                del batch[name]
+            elif status in FINISHED_TASK_STATES:
+                run_id = batch.pop(name)
+                if run_id in new_run_ids:
+                    run_ids.append(run_id)
+
+        return run_ids
 
     def terminate_manager(self):
         self._qcgpjm.finish()
         self._qcgpjm.stopManager()
         self._qcgpjm.cleanup()
 
-    def __submit_jobs(self, campaign, submit_order):
+    def __submit_jobs(self, campaign, runs, submit_order, submitted):
+        try:
+            self.__submit_runs(campaign, runs, submit_order, submitted)
+        finally:
+            submitted.put(None)
+
+    def __submit(self, jobs, tracked, submitted):
+        with self._qcgpjm_lock:
+            self._qcgpjm.submit(jobs)
+
+        if tracked:
+            submitted.put(tracked)
+
+    def __submit_runs(self, campaign, runs, submit_order, submitted):
 
         print("Starting submission of tasks to QCG Pilot Job Manager")
-        if submit_order == SubmitOrder.RUN_ORIENTED_CONDENSED:
-            for run in campaign.list_runs():
-                self._qcgpjm.submit(Jobs().addStd(self._get_encoding_and_exec_task(campaign, run)))
-
-        elif submit_order == SubmitOrder.RUN_ORIENTED:
-            for run in campaign.list_runs():
-                self._qcgpjm.submit(Jobs().addStd(self._get_encoding_task(campaign, run)))
-                self._qcgpjm.submit(Jobs().addStd(self._get_exec_task(campaign, run)))
-
-        elif submit_order == SubmitOrder.PHASE_ORIENTED:
-            for run in campaign.list_runs():
-                self._qcgpjm.submit(Jobs().addStd(self._get_encoding_task(campaign, run)))
-            for run in campaign.list_runs():
-                self._qcgpjm.submit(Jobs().addStd(self._get_exec_task(campaign, run)))
-
-        elif submit_order == SubmitOrder.EXEC_ONLY:
-            for run in campaign.list_runs():
-                self._qcgpjm.submit(Jobs().addStd(self._get_exec_only_task(campaign, run)))
+        chunks = _ChunkedSubmission(
+            lambda jobs, tracked: self.__submit(jobs, tracked, submitted),
+            self._submit_chunk_size)
+
+        self._submit_handlers[submit_order](campaign, runs, chunks)
+
+        chunks.flush()
+
+    @staticmethod
+    def __get_encoder_args(campaign):
+        # arguments of the encoder that are common for all runs of the campaign
+        return (
+            campaign.db_type,
+            campaign.db_location,
+            'FALSE',
+            campaign.campaign_name,
+            campaign._active_app_name
+        )
+
+    def __submit_run_oriented_condensed(self, campaign, runs, chunks):
+        enc_head = self.__get_encoder_args(campaign)
+        enc_exec_template = self._get_task_template(
+            self._encoding_and_execution_task, 'easyvvuq_encode_execute')
+        application = self._encoding_and_execution_task.get_params().get("application")
+
+        for key, run_data in runs:
+            chunks.add(self._get_encoding_and_exec_task(
+                enc_head, key, run_data, enc_exec_template, application), key)
+
+    def __submit_run_oriented(self, campaign, runs, chunks):
+        enc_head = self.__get_encoder_args(campaign)
+        enc_template = self._get_task_template(self._encoding_task, 'easyvvuq_encode')
+        exec_template = self._get_task_template(self._execution_task, 'easyvvuq_execute')
+        application = self._execution_task.get_params().get("application")
+
+        # the encoding task of a run is always submitted before or together with
+        # its execution task, which waits for it thanks to the dependencies
+        for key, run_data in runs:
+            chunks.add(self._get_encoding_task(enc_head, key, enc_template))
+            chunks.add(self._get_exec_task(key, run_data, exec_template, application), key)
+
+    def __submit_phase_oriented(self, campaign, runs, chunks):
+        enc_head = self.__get_encoder_args(campaign)
+        enc_template = self._get_task_template(self._encoding_task, 'easyvvuq_encode')
+        exec_template = self._get_task_template(self._execution_task, 'easyvvuq_execute')
+        application = self._execution_task.get_params().get("application")
+
+        for key, _ in runs:
+            chunks.add(self._get_encoding_task(enc_head, key, enc_template))
+        chunks.flush()
+
+        for key, run_data in runs:
+            chunks.add(self._get_exec_task(key, run_data, exec_template, application), key)
+
+    def __submit_exec_only(self, campaign, runs, chunks):
+        exec_template = self._get_task_template(self._execution_task, 'easyvvuq_execute')
+        application = self._execution_task.get_params().get("application")
+
+        for key, run_data in runs:
+            chunks.add(self._get_exec_only_task(key, run_data, exec_template, application), key)
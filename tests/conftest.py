@@ -0,0 +1,155 @@
+import sqlite3
+import sys
+import types
+from enum import Enum
+
+import pytest
+
+__license__ = "LGPL"
+
+
+class FakeStatus(Enum):
+    NEW = "NEW"
+    ENCODED = "ENCODED"
+    COLLATED = "COLLATED"
+
+
+class FakeJobs:
+    """Stands for qcg.appscheduler.api.job.Jobs, keeps the added task descriptions"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def addStd(self, task):
+        self.tasks.append(task)
+        return self
+
+
+class FakeManager:
+    """Stands for QCG Pilot Job Manager, all submitted tasks are immediately finished
+
+    Parameters
+    ----------
+    args : list, optional
+        Arguments of the LocalManager service
+    client_conf : dict, optional
+        Configuration of the LocalManager client
+    """
+
+    def __init__(self, args=None, client_conf=None):
+        self.args = args
+        self.client_conf = client_conf
+        self.submitted = []
+        self.status_calls = []
+        # names of tasks that are omitted in replies to status requests
+        self.unreported = set()
+        # number of successful submissions after which submit raises an error
+        self.fail_after = None
+        # names of tasks mapped to the number of status requests in which they are still running
+        self.running = {}
+
+    def submit(self, jobs):
+        if self.fail_after is not None and len(self.submitted) >= self.fail_after:
+            raise RuntimeError("submission failed")
+
+        self.submitted.append(jobs.tasks)
+
+    def status(self, names):
+        self.status_calls.append(list(names))
+
+        jobs = {}
+        for name in names:
+            if name in self.unreported:
+                continue
+
+            status = 'SUCCEED'
+            if self.running.get(name):
+                self.running[name] -= 1
+                status = 'EXECUTING'
+            jobs[name] = {'status': 0, 'data': {'jobName': name, 'status': status}}
+
+        return {'jobs': jobs}
+
+    def resources(self):
+        return {'total_cores': 4}
+
+    def wait4all(self):
+        pass
+
+
+class FakeCampaignDB:
+
+    def __init__(self, runs):
+        self._runs = runs
+        self.status_updates = []
+        # number of status updates that fail as if the database was locked
+        self.locked_updates = 0
+        self.run_ids_calls = []
+
+    def run_ids(self, status=None, app_id=None):
+        self.run_ids_calls.append((status, app_id))
+        return [run_id for run_id, run_data in self._runs.items()
+                if (status is None or run_data['status'] == status)
+                and (app_id is None or run_data['app'] == app_id)]
+
+    def set_run_statuses(self, run_ids, status):
+        if self.locked_updates:
+            self.locked_updates -= 1
+            raise sqlite3.OperationalError("database is locked")
+
+        self.status_updates.append((list(run_ids), status))
+        for run_id in run_ids:
+            self._runs[run_id]['status'] = status
+
+
+class FakeCampaign:
+    """Stands for easyvvuq.Campaign with the given number of NEW runs of its active app"""
+
+    def __init__(self, n_runs):
+        self.db_type = 'sql'
+        self.db_location = 'sqlite:///campaign.db'
+        self.campaign_name = 'fake'
+        self._active_app_name = 'fake_app'
+        self._active_app = {'id': 1, 'name': 'fake_app'}
+
+        self.list_runs_calls = 0
+
+        self.runs = {}
+        for i in range(1, n_runs + 1):
+            self.add_run(f"Run_{i}")
+        self.campaign_db = FakeCampaignDB(self.runs)
+
+    def add_run(self, run_id, app_id=1):
+        self.runs[run_id] = {
+            'run_dir': f"/runs/{run_id}",
+            'status': FakeStatus.NEW,
+            'app': app_id
+        }
+
+    def list_runs(self, sampler=None, status=None):
+        self.list_runs_calls += 1
+        return [(run_id, dict(run_data)) for run_id, run_data in self.runs.items()
+                if status is None or run_data['status'] == status]
+
+
+@pytest.fixture
+def fake_qcgpj(monkeypatch):
+    """Replaces the QCG Pilot Job API with FakeJobs and FakeManager"""
+    job = types.ModuleType('qcg.appscheduler.api.job')
+    job.Jobs = FakeJobs
+    manager = types.ModuleType('qcg.appscheduler.api.manager')
+    manager.LocalManager = FakeManager
+
+    for name in ['qcg', 'qcg.appscheduler', 'qcg.appscheduler.api']:
+        monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+    monkeypatch.setitem(sys.modules, job.__name__, job)
+    monkeypatch.setitem(sys.modules, manager.__name__, manager)
+
+
+@pytest.fixture
+def fake_easyvvuq(monkeypatch):
+    """Replaces easyvvuq with a module providing only the run statuses"""
+    easyvvuq = types.ModuleType('easyvvuq')
+    easyvvuq.constants = types.SimpleNamespace(Status=FakeStatus)
+
+    monkeypatch.setitem(sys.modules, 'easyvvuq', easyvvuq)
@@ -0,0 +1,122 @@
+import hashlib
+import os
+
+import pytest
+from conftest import FakeManager
+
+from easypj import TaskRequirements, Resources, Executor
+from easypj import Task, TaskType
+from easypj.core import executor as executor_module
+
+__license__ = "LGPL"
+
+
+def test_add_task_by_type():
+    executor = Executor()
+
+    encoding = Task(TaskType.ENCODING, TaskRequirements(cores=Resources(exact=1)), name="enc")
+    execution = Task(TaskType.EXECUTION, TaskRequirements(cores=Resources(exact=2)),
+                     application="app")
+
+    executor.add_task(encoding)
+    executor.add_task(execution)
+
+    assert executor._encoding_task is encoding
+    assert executor._execution_task is execution
+    assert executor._encoding_and_execution_task is None
+
+
+def test_add_task_unsupported_type():
+    executor = Executor()
+
+    with pytest.raises(ValueError):
+        executor.add_task(Task("ENCODING", TaskRequirements()))
+
+
+def test_create_manager_layout(fake_qcgpj, tmp_path):
+    executor = Executor()
+    executor.create_manager(dir=str(tmp_path), resources='4')
+
+    tempdir = executor._qcgpj_tempdir
+    assert os.path.dirname(tempdir) == str(tmp_path)
+    assert os.path.basename(tempdir).startswith(".qcgpj-")
+    assert sorted(os.listdir(tempdir)) == ['jobs', 'logs', 'work']
+    assert sorted(os.listdir(f"{tempdir}/logs")) == [f"{shard:02x}" for shard in range(256)]
+
+    args = executor._qcgpjm.args
+    assert args[args.index('--wd') + 1] == f"{tempdir}/jobs"
+    assert executor._qcgpjm.client_conf['log_file'] == f"{tempdir}/api.log"
+
+
+def test_logs_dir_shard(fake_qcgpj, tmp_path):
+    executor = Executor()
+    executor.create_manager(dir=str(tmp_path))
+
+    shard = hashlib.blake2s(b"Run_1", digest_size=1).hexdigest()
+    logs_dir = executor._get_logs_dir("Run_1")
+
+    assert logs_dir == f"{executor._qcgpj_tempdir}/logs/{shard}"
+    assert os.path.isdir(logs_dir)
+
+
+def test_set_manager_keeps_logs_in_tempdir(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    executor = Executor()
+    executor.set_manager(FakeManager())
+
+    assert executor._get_logs_dir("Run_1") == "."
+    assert os.listdir(tmp_path) == []
+
+
+def test_tmpfs_fallback_to_dir(fake_qcgpj, monkeypatch, tmp_path):
+    monkeypatch.setattr(executor_module, "SHM_DIR", str(tmp_path / "missing"))
+
+    executor = Executor()
+    executor.create_manager(dir=str(tmp_path), tmpfs=True)
+
+    assert os.path.dirname(executor._qcgpj_tempdir) == str(tmp_path)
+
+
+def test_tmpfs(fake_qcgpj, monkeypatch, tmp_path):
+    shm_dir = tmp_path / "shm"
+    shm_dir.mkdir()
+    monkeypatch.setattr(executor_module, "SHM_DIR", str(shm_dir))
+
+    executor = Executor()
+    executor.create_manager(dir=str(tmp_path), tmpfs=True)
+
+    assert os.path.dirname(executor._qcgpj_tempdir) == str(shm_dir)
+
+
+@pytest.mark.parametrize("scratch, tmpdir, expected", [
+    ("scratch", "tmp", "scratch"),
+    # TMPDIR may be node-local, so it is never used
+    (None, "tmp", "cwd"),
+    (None, None, "cwd"),
+])
+def test_create_manager_default_dir(fake_qcgpj, monkeypatch, tmp_path, scratch, tmpdir, expected):
+    for name in ["scratch", "tmp", "cwd"]:
+        (tmp_path / name).mkdir()
+    monkeypatch.chdir(tmp_path / "cwd")
+
+    for variable, value in [("EASYPJ_SCRATCH", scratch), ("TMPDIR", tmpdir)]:
+        if value:
+            monkeypatch.setenv(variable, str(tmp_path / value))
+        else:
+            monkeypatch.delenv(variable, raising=False)
+
+    executor = Executor()
+    executor.create_manager()
+
+    tempdir = os.path.realpath(executor._qcgpj_tempdir)
+    assert os.path.dirname(tempdir) == os.path.realpath(tmp_path / expected)
+
+
+def test_create_manager_explicit_dir(fake_qcgpj, monkeypatch, tmp_path):
+    monkeypatch.setenv("EASYPJ_SCRATCH", str(tmp_path / "scratch"))
+
+    executor = Executor()
+    executor.create_manager(dir=str(tmp_path))
+
+    assert os.path.dirname(executor._qcgpj_tempdir) == str(tmp_path)
@@ -0,0 +1,248 @@
+import hashlib
+
+import pytest
+from conftest import FakeCampaign, FakeManager, FakeStatus
+
+from easypj import TaskRequirements, Resources, Executor
+from easypj import Task, TaskType, SubmitOrder
+from easypj.core.executor import _ChunkedSubmission
+
+__license__ = "LGPL"
+
+
+@pytest.fixture
+def executor(fake_qcgpj, fake_easyvvuq):
+    executor = Executor(submit_chunk_size=4)
+    executor._status_poll_delay = 0.01
+    executor.set_manager(FakeManager())
+
+    executor.add_task(Task(
+        TaskType.ENCODING,
+        TaskRequirements(cores=Resources(exact=1))
+    ))
+    executor.add_task(Task(
+        TaskType.EXECUTION,
+        TaskRequirements(cores=Resources(exact=1)),
+        application='app'
+    ))
+    executor.add_task(Task(
+        TaskType.ENCODING_AND_EXECUTION,
+        TaskRequirements(cores=Resources(exact=1)),
+        application='app'
+    ))
+
+    return executor
+
+
+@pytest.mark.parametrize("submit_order", list(SubmitOrder))
+def test_run_marks_new_runs_encoded(executor, submit_order):
+    campaign = FakeCampaign(10)
+
+    executor.run(campaign, submit_order)
+
+    assert all(run['status'] == FakeStatus.ENCODED for run in campaign.runs.values())
+
+    updated = [run_id for run_ids, _ in campaign.campaign_db.status_updates for run_id in run_ids]
+    assert sorted(updated) == sorted(campaign.runs)
+
+
+def test_run_polls_bounded_batches(executor):
+    campaign = FakeCampaign(10)
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    status_calls = executor._qcgpjm.status_calls
+    assert status_calls
+    assert all(len(names) <= executor._submit_chunk_size for names in status_calls)
+
+
+def test_run_skips_runs_not_new(executor):
+    campaign = FakeCampaign(5)
+    campaign.runs["Run_3"]['status'] = FakeStatus.COLLATED
+
+    executor.run(campaign, SubmitOrder.RUN_ORIENTED)
+
+    assert campaign.runs["Run_3"]['status'] == FakeStatus.COLLATED
+    assert all("Run_3" not in run_ids for run_ids, _ in campaign.campaign_db.status_updates)
+    assert all(run['status'] == FakeStatus.ENCODED
+               for run_id, run in campaign.runs.items() if run_id != "Run_3")
+
+
+def test_run_with_unreported_task(executor):
+    campaign = FakeCampaign(5)
+    executor._qcgpjm.unreported = {"execute_Run_2"}
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    # the run of the unreported task is updated after completion of all tasks
+    assert all(run['status'] == FakeStatus.ENCODED for run in campaign.runs.values())
+    assert campaign.campaign_db.status_updates[-1] == (["Run_2"], FakeStatus.ENCODED)
+    assert all("execute_Run_2" not in names for names in executor._qcgpjm.status_calls[1:])
+
+
+def test_run_submission_error(executor):
+    campaign = FakeCampaign(10)
+    executor._qcgpjm.fail_after = 1
+
+    with pytest.raises(RuntimeError):
+        executor.run(campaign, SubmitOrder.RUN_ORIENTED)
+
+    assert len(executor._qcgpjm.submitted) == 1
+
+
+def test_chunked_submission(fake_qcgpj):
+    bundles = []
+    chunks = _ChunkedSubmission(lambda jobs, tracked: bundles.append((jobs, tracked)), 3)
+
+    # nothing is submitted for an empty chunk
+    chunks.flush()
+    assert bundles == []
+
+    for i in range(1, 8):
+        chunks.add({"name": f"encode_Run_{i}"})
+        chunks.add({"name": f"execute_Run_{i}"}, f"Run_{i}")
+    chunks.flush()
+    chunks.flush()
+
+    assert [len(jobs.tasks) for jobs, _ in bundles] == [3, 3, 3, 3, 2]
+
+    for jobs, tracked in bundles:
+        names = [task["name"] for task in jobs.tasks]
+        assert sorted(tracked) == sorted(name for name in names if name.startswith("execute_"))
+        assert all(tracked[name] == name[len("execute_"):] for name in tracked)
+
+
+def test_run_oriented_chunks(executor):
+    executor._submit_chunk_size = 7
+
+    executor.run(FakeCampaign(20), SubmitOrder.RUN_ORIENTED)
+
+    bundles = [[task["name"] for task in tasks] for tasks in executor._qcgpjm.submitted]
+    assert [len(names) for names in bundles] == [7, 7, 7, 7, 7, 5]
+
+    # encoding task of a run is never submitted after its execution task
+    submitted = [name for names in bundles for name in names]
+    for i in range(1, 21):
+        assert submitted.index(f"encode_Run_{i}") < submitted.index(f"execute_Run_{i}")
+
+
+def test_phase_oriented_chunks(executor):
+    executor._submit_chunk_size = 7
+
+    executor.run(FakeCampaign(20), SubmitOrder.PHASE_ORIENTED)
+
+    bundles = [[task["name"] for task in tasks] for tasks in executor._qcgpjm.submitted]
+    assert [len(names) for names in bundles] == [7, 7, 6, 7, 7, 6]
+
+    assert all(name.startswith("encode_") for names in bundles[:3] for name in names)
+    assert all(name.startswith("execute_") for names in bundles[3:] for name in names)
+
+
+def test_run_sweep_skips_runs_of_other_apps(executor):
+    campaign = FakeCampaign(5)
+    campaign.add_run("Other_1", app_id=2)
+    # the task of the run isn't synced during the execution, so only the final sweep may update it
+    executor._qcgpjm.unreported = {"execute_Other_1"}
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    assert campaign.runs["Other_1"]['status'] == FakeStatus.NEW
+    assert all(run['status'] == FakeStatus.ENCODED
+               for run_id, run in campaign.runs.items() if run_id != "Other_1")
+
+
+def test_run_lists_runs_once(executor):
+    campaign = FakeCampaign(5)
+    campaign.add_run("Other_1", app_id=2)
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    assert campaign.list_runs_calls == 1
+    assert campaign.runs["Other_1"]['status'] == FakeStatus.NEW
+
+
+def test_run_with_locked_database(executor):
+    campaign = FakeCampaign(10)
+    campaign.campaign_db.locked_updates = 1
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    # runs which couldn't be updated during the execution are updated by the final sweep
+    assert all(run['status'] == FakeStatus.ENCODED for run in campaign.runs.values())
+
+
+def test_run_long_task_does_not_block_syncing(executor):
+    campaign = FakeCampaign(8)
+    executor._qcgpjm.running = {"execute_Run_1": 5}
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    updates = [run_ids for run_ids, _ in campaign.campaign_db.status_updates]
+    run_1 = next(i for i, run_ids in enumerate(updates) if "Run_1" in run_ids)
+    run_5 = next(i for i, run_ids in enumerate(updates) if "Run_5" in run_ids)
+    assert run_5 < run_1
+    assert all(len(names) <= executor._submit_chunk_size
+               for names in executor._qcgpjm.status_calls)
+
+
+def expected_tasks(tempdir, key, submit_order):
+    """Builds the full QCG PJ task descriptions expected for the run `key`"""
+    logs_dir = f"{tempdir}/logs/{hashlib.blake2s(key.encode(), digest_size=1).hexdigest()}"
+    enc_head = ['sql', 'sqlite:///campaign.db', 'FALSE', 'fake', 'fake_app', key]
+    exec_tail = [f"/runs/{key}", 'easyvvuq_app', 'app']
+
+    def task(prefix, exec, args, cores):
+        return {
+            "name": f"{prefix}_{key}",
+            "execution": {
+                "exec": exec,
+                "wd": f"{tempdir}/work",
+                "args": args,
+                "stdout": f"{logs_dir}/{prefix}_{key}.stdout",
+                "stderr": f"{logs_dir}/{prefix}_{key}.stderr"
+            },
+            "resources": {"numCores": {"exact": cores}}
+        }
+
+    if submit_order == SubmitOrder.RUN_ORIENTED_CONDENSED:
+        return [task("encode_execute", 'easyvvuq_encode_execute', enc_head + exec_tail, 3)]
+
+    execute_task = task("execute", 'easyvvuq_execute', exec_tail, 2)
+    if submit_order == SubmitOrder.EXEC_ONLY:
+        return [execute_task]
+
+    execute_task["dependencies"] = {"after": [f"encode_{key}"]}
+    return [task("encode", 'easyvvuq_encode', enc_head, 1), execute_task]
+
+
+@pytest.mark.parametrize("submit_order", list(SubmitOrder))
+def test_run_task_descriptions(fake_qcgpj, fake_easyvvuq, tmp_path, submit_order):
+    executor = Executor()
+    executor._status_poll_delay = 0.01
+    executor.create_manager(dir=str(tmp_path))
+
+    executor.add_task(Task(TaskType.ENCODING, TaskRequirements(cores=Resources(exact=1))))
+    executor.add_task(Task(TaskType.EXECUTION, TaskRequirements(cores=Resources(exact=2)),
+                           application='app'))
+    executor.add_task(Task(TaskType.ENCODING_AND_EXECUTION,
+                           TaskRequirements(cores=Resources(exact=3)), application='app'))
+
+    campaign = FakeCampaign(3)
+    executor.run(campaign, submit_order)
+
+    submitted = {task["name"]: task for tasks in executor._qcgpjm.submitted for task in tasks}
+    expected = [task for key in campaign.runs
+                for task in expected_tasks(executor._qcgpj_tempdir, key, submit_order)]
+    assert submitted == {task["name"]: task for task in expected}
+
+
+def test_run_sweep_fetches_only_run_ids(executor):
+    campaign = FakeCampaign(5)
+    executor._qcgpjm.unreported = {"execute_Run_4"}
+
+    executor.run(campaign, SubmitOrder.EXEC_ONLY)
+
+    # the sweep asks for ids of the NEW runs of the active app instead of listing whole runs
+    assert campaign.list_runs_calls == 1
+    assert campaign.campaign_db.run_ids_calls == [(FakeStatus.NEW, 1)]
+    assert campaign.campaign_db.status_updates[-1] == (["Run_4"], FakeStatus.ENCODED)